@@ -0,0 +1,68 @@
+"""HTTP session construction, imported only once a session is needed."""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import requests  # type: ignore
+    from requests.adapters import HTTPAdapter  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    requests = None  # type: ignore[assignment]
+    HTTPAdapter = None  # type: ignore[assignment]
+
+try:  # pragma: no cover - optional dependency
+    from urllib3.util.retry import Retry  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    Retry = None  # type: ignore[assignment]
+
+AVAILABLE = requests is not None and HTTPAdapter is not None and Retry is not None
+
+
+if HTTPAdapter is not None:
+
+    class _TimeoutAdapter(HTTPAdapter):  # type: ignore[misc, valid-type]
+        """HTTPAdapter that applies the configured timeout to requests that do not set one."""
+
+        __attrs__ = HTTPAdapter.__attrs__ + ["default_timeout"]
+
+        def __init__(self, default_timeout: float, **kwargs: Any) -> None:
+            self.default_timeout = default_timeout
+            super().__init__(**kwargs)
+
+        def send(self, request, timeout=None, **kwargs):  # type: ignore[override]
+            # Session.request always forwards timeout, as None when the caller gave none.
+            return super().send(request, timeout=self.default_timeout if timeout is None else timeout, **kwargs)
+
+
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_METHODS = frozenset({"GET", "POST"})
+
+
+@lru_cache(maxsize=8)
+def _retry_policy(max_retries: int, backoff_s: float):
+    # Retry objects are never mutated (urllib3 derives a new one per attempt), so sessions can share one.
+    return Retry(
+        total=max_retries,
+        read=max_retries,
+        connect=max_retries,
+        backoff_factor=backoff_s,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=_RETRY_METHODS,
+    )
+
+
+def build_session(settings, pool_size: int, pool_connections: int):
+    session = requests.Session()
+    session.headers.update({"User-Agent": settings.user_agent})
+    retry = _retry_policy(settings.max_retries, settings.backoff_s)
+    # pool_connections is how many hosts keep a pool; pool_size caps connections per host.
+    adapter = _TimeoutAdapter(
+        settings.timeout_s,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
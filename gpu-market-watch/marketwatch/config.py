@@ -2,8 +2,12 @@
 from __future__ import annotations
 
 import copy
+import hashlib
+import json
 import os
 import re
+import tempfile
+from collections import OrderedDict
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
@@ -14,6 +18,12 @@ try:  # pragma: no cover - optional dependency
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
     yaml = None  # type: ignore[assignment]
 
+if yaml is not None:  # pragma: no cover - exercised when dependency present
+    # Prefer the LibYAML bindings; they parse several times faster than the pure-Python loader.
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+else:  # pragma: no cover - optional dependency
+    _YAML_LOADER = None
+
 
 ROOT = Path(__file__).resolve().parent.parent
 CONFIG_DIR = ROOT / "config"
@@ -91,6 +101,10 @@ _FALLBACK_CONFIGS: Dict[str, Dict[str, Any]] = {
     },
 }
 
+# Serialized once so each fallback lookup gets a fresh copy from a C-level json.loads instead
+# of a recursive copy.deepcopy.
+_FALLBACK_JSON: Dict[str, str] = {name: json.dumps(value) for name, value in _FALLBACK_CONFIGS.items()}
+
 
 @dataclass
 class HttpSettings:
@@ -134,6 +148,11 @@ _DEFAULT_ENV_OVERRIDES: Dict[str, Dict[str, tuple[str, ...]]] = {
 }
 
 _ENV_SANITIZE = re.compile(r"[^A-Z0-9]+")
+_ENV_PREFIX = "GPU_MARKET_"
+
+# Parsed YAML documents keyed by (path, mtime_ns, size) so repeated loads skip parsing.
+_YAML_CACHE: "OrderedDict[tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_YAML_CACHE_MAX = 32
 
 
 @dataclass
@@ -166,17 +185,23 @@ def load_settings(path: Optional[Path] = None) -> Settings:
 @lru_cache(maxsize=1)
 def load_providers(path: Optional[Path] = None) -> List[ProviderConfig]:
     cfg_path = path or CONFIG_DIR / "providers.yaml"
-    data = _load_yaml(cfg_path)
+    data = _load_prebuilt_providers(cfg_path) if path is None else None
+    if data is None:
+        data = _load_yaml(cfg_path)
+    raw_providers = data.get("providers", [])
+    env_by_provider = _collect_provider_env([str(raw.get("id")) for raw in raw_providers])
     providers: List[ProviderConfig] = []
-    for raw in data.get("providers", []):
+    for raw in raw_providers:
+        provider_id = str(raw.get("id"))
         providers.append(
             ProviderConfig(
-                id=str(raw.get("id")),
+                id=provider_id,
                 enabled=bool(raw.get("enabled", True)),
                 module=str(raw.get("module")),
                 extra=_merge_provider_env(
-                    str(raw.get("id")),
+                    provider_id,
                     {k: v for k, v in raw.items() if k not in {"id", "enabled", "module"}},
+                    env_by_provider.get(provider_id, {}),
                 ),
             )
         )
@@ -195,112 +220,201 @@ def load_dashboard(path: Optional[Path] = None) -> DashboardConfig:
 
 
 def _load_yaml(path: Path) -> Dict[str, Any]:
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached)
+
+    data = _read_yaml_sidecar(path, stat)
+    if data is None:
+        data = _parse_yaml_file(path)
+        if data is None:
+            return json.loads(_FALLBACK_JSON[path.name])
+        _write_yaml_sidecar(path, stat, data)
+    _YAML_CACHE[key] = data
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
+    # Hand out copies so callers mutating the result cannot corrupt the cache.
+    return copy.deepcopy(data)
+
+
+def _load_prebuilt_providers(path: Path) -> Optional[Dict[str, Any]]:
+    """Return the build-time copy of ``providers.yaml`` if it matches the file on disk.
+
+    The content digest (not the mtime, which git checkouts reset) decides freshness, so an
+    edited YAML file without a regenerated module simply falls through to parsing.
+    """
+    try:
+        from . import providers_default
+    except ImportError:  # pragma: no cover - module is generated
+        return None
+    try:
+        digest = _config_digest(path.read_bytes())
+    except OSError:
+        return None
+    if digest != providers_default.SOURCE_DIGEST:
+        return None
+    return copy.deepcopy(providers_default.DATA)
+
+
+def _config_digest(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _parse_yaml_file(path: Path) -> Optional[Dict[str, Any]]:
+    """Parse ``path``, returning ``None`` when only the bundled fallback applies."""
     if yaml is not None:  # pragma: no cover - exercised when dependency present
-        with path.open("r", encoding="utf-8") as fh:
-            return yaml.safe_load(fh) or {}
+        return yaml.load(path.read_bytes(), Loader=_YAML_LOADER) or {}
 
     text = path.read_text(encoding="utf-8")
     try:
         return _parse_simple_yaml(text)
     except Exception:
-        fallback = _FALLBACK_CONFIGS.get(path.name)
-        if fallback is None:
+        if path.name not in _FALLBACK_CONFIGS:
             raise
-        return copy.deepcopy(fallback)
+        return None
+
+
+def _yaml_sidecar_path(path: Path) -> Path:
+    return path.with_name(path.name + ".cache.json")
+
+
+def _read_yaml_sidecar(path: Path, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Return the JSON copy of ``path`` written by a previous run if it is still current."""
+    try:
+        cached = json.loads(_yaml_sidecar_path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict):
+        return None
+    # Compare against the recorded source stat rather than the sidecar's own mtime, which
+    # can tie with the YAML file's on filesystems with coarse timestamps.
+    if cached.get("mtime_ns") != stat.st_mtime_ns or cached.get("size") != stat.st_size:
+        return None
+    data = cached.get("data")
+    return data if isinstance(data, dict) else None
+
+
+def _write_yaml_sidecar(path: Path, stat: os.stat_result, data: Dict[str, Any]) -> None:
+    try:
+        payload = json.dumps({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "data": data})
+    except (TypeError, ValueError):
+        return  # YAML produced values JSON cannot represent (e.g. dates); skip the sidecar.
+    # json.dumps silently stringifies non-str keys (404:, true:), so only keep a sidecar that
+    # reads back as the same data.
+    if json.loads(payload)["data"] != data:
+        return
+    sidecar = _yaml_sidecar_path(path)
+    try:
+        tmp_fd, tmp_path = tempfile.mkstemp(dir=str(sidecar.parent), prefix=".tmp", suffix=".json")
+        with os.fdopen(tmp_fd, "w", encoding="utf-8") as fh:
+            fh.write(payload)
+        os.replace(tmp_path, sidecar)
+    except OSError:  # pragma: no cover - read-only checkouts simply skip the sidecar
+        pass
 
 
 def _parse_simple_yaml(text: str) -> Dict[str, Any]:
-    lines = [line.rstrip("\n") for line in text.splitlines() if line.strip() and not line.lstrip().startswith("#")]
-    if not lines:
+    # One lstrip per line yields both the content and its indentation.
+    parsed: list[tuple[int, str]] = []
+    for line in text.splitlines():
+        content = line.lstrip(" ")
+        if not content or content.isspace() or content[0] == "#":
+            continue
+        parsed.append((len(line) - len(content), content))
+    if not parsed:
         return {}
-    parsed, index = _parse_yaml_block(lines, 0, 0)
-    if index != len(lines):  # pragma: no cover - defensive
-        raise ValueError("Unparsed YAML content remains")
-    if not isinstance(parsed, dict):
+    if _is_list_item(parsed[0][1]):
         raise ValueError("Top-level YAML structure must be a mapping")
-    return parsed
-
 
-def _parse_yaml_block(lines: list[str], index: int, indent: int):
-    mapping: Dict[str, Any] = {}
-    items: list[Any] = []
-    is_list: Optional[bool] = None
-    while index < len(lines):
-        line = lines[index]
-        current_indent = len(line) - len(line.lstrip(" "))
-        if current_indent < indent:
-            break
-        stripped = line.strip()
-        if not stripped:
-            index += 1
-            continue
-        if stripped.startswith("- "):
-            if is_list is False:
+    root: Dict[str, Any] = {}
+    # Each frame is (indent, container); every entry of a container sits at the frame's indent.
+    stack: list[tuple[int, Any]] = [(parsed[0][0], root)]
+    # A "key:" (or bare "-") line whose value is the block that follows: (parent, key, owner indent).
+    pending: Optional[tuple[Any, Optional[str], int]] = None
+    index = 0
+    while index < len(parsed):
+        indent, content = parsed[index]
+        if pending is not None:
+            parent, key, owner_indent = pending
+            pending = None
+            child: Any = {}
+            if indent > owner_indent:
+                child = [] if _is_list_item(content) else {}
+                stack.append((indent, child))
+            _attach(parent, key, child)
+
+        while len(stack) > 1 and indent < stack[-1][0]:
+            stack.pop()
+        frame_indent, container = stack[-1]
+        if indent != frame_indent:
+            raise ValueError(f"Unexpected indentation: {content}")
+
+        if _is_list_item(content):
+            if not isinstance(container, list):
                 raise ValueError("Mixed list and mapping in YAML block")
-            is_list = True
-            value_part = stripped[2:].strip()
-            if value_part and ":" in value_part:
-                key, rest = value_part.split(":", 1)
-                key = key.strip().strip('"\'')
-                rest = rest.strip()
-                value: Any
-                if rest == "|":
-                    value, index = _collect_block_string(lines, index + 1, current_indent + 2)
-                elif rest:
-                    value = _parse_scalar(rest)
-                    index += 1
-                else:
-                    index += 1
-                    value, index = _parse_yaml_block(lines, index, current_indent + 2)
-                nested, index = _parse_yaml_block(lines, index, current_indent + 2)
-                if not isinstance(nested, dict):
-                    nested = {}
-                entry = {key: value}
-                entry.update(nested)
-                items.append(entry)
+            value_part = content[1:].lstrip(" ")
+            if not value_part:
+                pending = (container, None, indent)
+                index += 1
                 continue
-            if value_part:
-                items.append(_parse_scalar(value_part))
+            if ":" not in value_part:
+                container.append(_parse_scalar(value_part.strip()))
                 index += 1
                 continue
-            index += 1
-            value, index = _parse_yaml_block(lines, index, current_indent + 2)
-            items.append(value)
-            continue
-
-        if is_list:
-            break
-
-        if ":" not in stripped:
-            raise ValueError(f"Invalid line: {line}")
-        key, rest = stripped.split(":", 1)
+            # "- key: value" opens a mapping whose keys align with the first key.
+            entry: Dict[str, Any] = {}
+            container.append(entry)
+            indent += len(content) - len(value_part)
+            container = entry
+            stack.append((indent, entry))
+            content = value_part
+        elif isinstance(container, list):
+            raise ValueError("Mixed list and mapping in YAML block")
+
+        if ":" not in content:
+            raise ValueError(f"Invalid line: {content}")
+        key, rest = content.split(":", 1)
         key = key.strip().strip('"\'')
         rest = rest.strip()
         if rest == "|":
-            value, index = _collect_block_string(lines, index + 1, current_indent + 2)
-            mapping[key] = value
+            container[key], index = _collect_block_string(parsed, index + 1, indent)
             continue
         if rest:
-            mapping[key] = _parse_scalar(rest)
-            index += 1
-            continue
+            container[key] = _parse_scalar(rest)
+        else:
+            pending = (container, key, indent)
         index += 1
-        value, index = _parse_yaml_block(lines, index, current_indent + 2)
-        mapping[key] = value
 
-    if is_list:
-        return items, index
-    return mapping, index
+    if pending is not None:
+        parent, key, _ = pending
+        _attach(parent, key, {})
+    return root
+
+
+def _is_list_item(content: str) -> bool:
+    return content == "-" or content.startswith("- ")
 
 
-def _collect_block_string(lines: list[str], index: int, indent: int):
+def _attach(parent: Any, key: Optional[str], value: Any) -> None:
+    if key is None:
+        parent.append(value)
+    else:
+        parent[key] = value
+
+
+def _collect_block_string(parsed: list[tuple[int, str]], index: int, owner_indent: int) -> tuple[str, int]:
     parts: list[str] = []
-    while index < len(lines):
-        line = lines[index]
-        current_indent = len(line) - len(line.lstrip(" "))
-        if current_indent < indent:
+    block_indent: Optional[int] = None
+    while index < len(parsed):
+        indent, content = parsed[index]
+        if indent <= owner_indent:
             break
-        parts.append(line[indent:])
+        if block_indent is None:
+            block_indent = indent
+        parts.append(" " * max(indent - block_indent, 0) + content)
         index += 1
     return "\n".join(parts), index
 
@@ -325,22 +439,47 @@ def _parse_scalar(token: str) -> Any:
         return token
 
 
+@lru_cache(maxsize=None)
 def project_path(*parts: str) -> Path:
     return ROOT.joinpath(*parts)
 
 
-def _merge_provider_env(provider_id: str, extra: Dict[str, Any]) -> Dict[str, Any]:
+def _collect_provider_env(provider_ids: List[str]) -> Dict[str, Dict[str, str]]:
+    """Group ``GPU_MARKET_<PROVIDER>_<KEY>`` variables by provider in one pass over the environment.
+
+    When one provider's normalized id is a prefix of another's (``VAST`` and ``VAST_AI``), a
+    variable goes to the longest match.
+    """
+    ids_by_component: Dict[str, List[str]] = {}
+    for provider_id in provider_ids:
+        if provider_id:
+            ids_by_component.setdefault(_normalize_env_component(provider_id), []).append(provider_id)
+    env_by_provider: Dict[str, Dict[str, str]] = {
+        provider_id: {} for ids in ids_by_component.values() for provider_id in ids
+    }
+    if not ids_by_component:
+        return env_by_provider
+
+    alternatives = "|".join(re.escape(component) for component in sorted(ids_by_component, key=len, reverse=True))
+    pattern = re.compile(rf"{_ENV_PREFIX}({alternatives})_(.+)")
+    for env_name, env_value in os.environ.items():
+        match = pattern.match(env_name)
+        if match is None:
+            continue
+        key = _normalize_env_key(match.group(2))
+        if not key:
+            continue
+        for provider_id in ids_by_component[match.group(1)]:
+            env_by_provider[provider_id][key] = env_value
+    return env_by_provider
+
+
+def _merge_provider_env(provider_id: str, extra: Dict[str, Any], env_values: Dict[str, str]) -> Dict[str, Any]:
     if not provider_id:
         return extra
 
     merged = dict(extra)
-    normalized_id = _normalize_env_component(provider_id)
-    prefix = f"GPU_MARKET_{normalized_id}_"
-    for env_name, env_value in os.environ.items():
-        if env_name.startswith(prefix):
-            key = _normalize_env_key(env_name[len(prefix) :])
-            if key:
-                merged[key] = env_value
+    merged.update(env_values)
 
     overrides = _DEFAULT_ENV_OVERRIDES.get(provider_id.lower()) or {}
     for target_key, candidates in overrides.items():
@@ -4,8 +4,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List
 
-from ..schema import GpuPrice, validate_and_normalize
-from ..util import load_json_snapshot, log, parse_float
+from ..schema import GpuPrice, validate_and_normalize_batch
+from ..util import load_json_snapshot, log, parse_float, response_json
 
 DEFAULT_ENDPOINT = "https://cloud.lambdalabs.com/api/v1/instance-types"
 
@@ -16,7 +16,7 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
     try:
         response = session.get(url)
         response.raise_for_status()
-        payload = response.json()
+        payload = response_json(response)
     except Exception as exc:  # pragma: no cover - defensive
         log("WARN", f"lambda: failed to fetch pricing ({exc})")
         payload = load_json_snapshot(cfg.id)
@@ -30,7 +30,7 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
     else:
         items = instances
 
-    results: List[GpuPrice] = []
+    raw_records: List[dict] = []
     for item in items:
         gpu_name = item.get("gpu_type") or item.get("name")
         hourly_price = (
@@ -53,8 +53,8 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
             "source_url": url,
             "fetched_at": now,
         }
-        results.append(validate_and_normalize(record, now))
-    return results
+        raw_records.append(record)
+    return validate_and_normalize_batch(raw_records, now)
 
 
 __all__ = ["fetch"]
@@ -1,15 +1,17 @@
 """Modal Labs pricing provider."""
 from __future__ import annotations
 
+import re
 from datetime import datetime
+from functools import lru_cache
 from typing import List
 
-from bs4 import BeautifulSoup
-
-from ..schema import GpuPrice, validate_and_normalize
+from ..schema import GpuPrice, validate_and_normalize_batch
 from ..util import log, parse_money
 
 DEFAULT_URL = "https://modal.com/pricing"
+# lxml refuses str input that still carries an encoding declaration; the text is already decoded.
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
 
 
 def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
@@ -21,19 +23,20 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
         log("WARN", f"modal: failed to fetch pricing ({exc})")
         return []
 
-    soup = BeautifulSoup(response.text, "lxml")
-    table = soup.find("table")
-    if not table:
+    table = _find_table(response.text)
+    if table is None:
         log("WARN", "modal: pricing table not found, skipping")
         return []
 
-    headers = [th.get_text(strip=True).lower() for th in table.find_all("th")]
-    results: List[GpuPrice] = []
-    for row in table.find_all("tr"):
-        cells = [td.get_text(strip=True) for td in row.find_all("td")]
-        if not cells or len(cells) != len(headers):
+    headers = [_cell_text(th).lower() for th in table.iter("th")]
+    n_headers = len(headers)
+    raw_records: List[dict] = []
+    for row in table.iter("tr"):
+        cells = list(row.iter("td"))
+        # Header rows have no <td>; check the shape before extracting any text.
+        if not cells or len(cells) != n_headers:
             continue
-        data = dict(zip(headers, cells))
+        data = dict(zip(headers, map(_cell_text, cells)))
         gpu_name = data.get("gpu") or data.get("hardware")
         price = parse_money(data.get("price") or data.get("$/hr") or data.get("usd/hr"))
         if not gpu_name or price is None:
@@ -49,8 +52,32 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
             "source_url": url,
             "fetched_at": now,
         }
-        results.append(validate_and_normalize(record, now))
-    return results
+        raw_records.append(record)
+    return validate_and_normalize_batch(raw_records, now)
+
+
+def _find_table(markup: str):
+    # Imported lazily: the registry imports every enabled provider at startup.
+    from lxml import etree, html
+
+    try:
+        document = html.fromstring(_XML_DECLARATION.sub("", markup, count=1))
+    except (etree.ParserError, ValueError):
+        return None
+    return next(document.iter("table"), None)
+
+
+@lru_cache(maxsize=1)
+def _cell_text_nodes():
+    from lxml import etree
+
+    # The text nodes BeautifulSoup's get_text() keeps: no comments, nothing inside <script>/<style>.
+    return etree.XPath("descendant::text()[not(ancestor::script or ancestor::style)]")
+
+
+def _cell_text(element) -> str:
+    # Mirrors BeautifulSoup's get_text(strip=True): strip each text node and join them.
+    return "".join(part.strip() for part in _cell_text_nodes()(element))
 
 
 __all__ = ["fetch"]
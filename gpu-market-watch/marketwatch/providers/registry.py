@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import importlib
+from functools import lru_cache
 from typing import Callable, List
 
 from ..config import ProviderConfig, load_providers
@@ -19,6 +20,7 @@ def get_enabled_providers() -> List[tuple[ProviderConfig, FetchFunc]]:
     return providers
 
 
+@lru_cache(maxsize=None)
 def load_callable(path: str) -> FetchFunc:
     module_name, func_name = path.split(":", 1)
     module = importlib.import_module(module_name)
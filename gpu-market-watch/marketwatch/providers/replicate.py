@@ -4,8 +4,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List
 
-from ..schema import GpuPrice, validate_and_normalize
-from ..util import load_json_snapshot, log, parse_float
+from ..schema import GpuPrice, validate_and_normalize_batch
+from ..util import load_json_snapshot, log, parse_float, response_json
 
 DEFAULT_ENDPOINT = "https://api.replicate.com/v1/pricing"
 
@@ -19,7 +19,7 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
     try:
         response = session.get(url, headers=headers)
         response.raise_for_status()
-        payload = response.json()
+        payload = response_json(response)
     except Exception as exc:  # pragma: no cover - defensive
         log("WARN", f"replicate: failed to fetch pricing ({exc})")
         payload = load_json_snapshot(cfg.id)
@@ -28,7 +28,7 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
         log("INFO", "replicate: using bundled snapshot data")
 
     records = payload.get("prices") or payload.get("hardware") or []
-    results: List[GpuPrice] = []
+    raw_records: List[dict] = []
     for item in records:
         gpu_name = item.get("gpu") or item.get("name")
         per_minute = parse_float(item.get("usd_per_minute") or item.get("price_per_minute"))
@@ -48,8 +48,8 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
             "source_url": url,
             "fetched_at": now,
         }
-        results.append(validate_and_normalize(record, now))
-    return results
+        raw_records.append(record)
+    return validate_and_normalize_batch(raw_records, now)
 
 
 __all__ = ["fetch"]
@@ -4,8 +4,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List
 
-from ..schema import GpuPrice, validate_and_normalize
-from ..util import load_json_snapshot, log, parse_float
+from ..schema import GpuPrice, validate_and_normalize_batch
+from ..util import first_present, load_json_snapshot, log, parse_float, response_json
 
 
 def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
@@ -14,7 +14,7 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
     try:
         response = session.get(url)
         response.raise_for_status()
-        payload = response.json()
+        payload = response_json(response)
     except Exception as exc:  # pragma: no cover - defensive
         log("WARN", f"runpod: failed to fetch pricing ({exc})")
         payload = load_json_snapshot(cfg.id)
@@ -22,11 +22,11 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
             return []
         log("INFO", "runpod: using bundled snapshot data")
 
-    records = payload.get("data") or payload.get("pricings") or payload
+    records = first_present(payload, ("data", "pricings"), payload)
     if isinstance(records, dict):
         records = records.get("gpus") or []
 
-    results: List[GpuPrice] = []
+    raw_records: List[dict] = []
     for item in records:
         gpu_name = item.get("gpu") or item.get("name")
         price = parse_float(item.get("usd_per_hour") or item.get("price_per_hour") or item.get("hourly"))
@@ -43,8 +43,8 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
             "source_url": url,
             "fetched_at": now,
         }
-        results.append(validate_and_normalize(record, now))
-    return results
+        raw_records.append(record)
+    return validate_and_normalize_batch(raw_records, now)
 
 
 __all__ = ["fetch"]
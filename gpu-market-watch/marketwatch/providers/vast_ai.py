@@ -4,8 +4,8 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List
 
-from ..schema import GpuPrice, validate_and_normalize
-from ..util import load_json_snapshot, log, parse_float
+from ..schema import GpuPrice, validate_and_normalize_batch
+from ..util import first_present, load_json_snapshot, log, parse_float, response_json
 
 
 def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
@@ -14,7 +14,7 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
     try:
         response = session.get(url)
         response.raise_for_status()
-        payload = response.json()
+        payload = response_json(response)
     except Exception as exc:  # pragma: no cover - defensive
         log("WARN", f"vast_ai: failed to fetch pricing ({exc})")
         payload = load_json_snapshot(cfg.id)
@@ -22,8 +22,8 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
             return []
         log("INFO", "vast_ai: using bundled snapshot data")
 
-    offers = payload.get("offers") or payload.get("data") or []
-    results: List[GpuPrice] = []
+    offers = first_present(payload, ("offers", "data"), [])
+    raw_records: List[dict] = []
     for offer in offers:
         gpu_name = offer.get("gpu_name") or offer.get("gpu_type") or offer.get("gpu")
         price = parse_float(offer.get("dph_total") or offer.get("price_per_gpu_hour") or offer.get("total_hourly_cost"))
@@ -40,8 +40,8 @@ def fetch(session, cfg, now: datetime) -> List[GpuPrice]:
             "source_url": url,
             "fetched_at": now,
         }
-        results.append(validate_and_normalize(record, now))
-    return results
+        raw_records.append(record)
+    return validate_and_normalize_batch(raw_records, now)
 
 
 __all__ = ["fetch"]
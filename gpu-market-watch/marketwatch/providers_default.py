@@ -0,0 +1,30 @@
+"""Prebuilt copy of ``config/providers.yaml``.
+
+Generated by ``scripts/build_providers_default.py``; do not edit by hand. ``load_providers``
+uses it only while ``SOURCE_DIGEST`` matches the YAML file on disk.
+"""
+
+SOURCE_DIGEST = '53e74efe1e0c877a48010481b471fef9'
+
+DATA = {   'providers': [   {   'id': 'huggingface_endpoints',
+                         'enabled': True,
+                         'module': 'marketwatch.providers.hf_endpoints:fetch',
+                         'notes': 'Prefer official pricing JSON or docs API; otherwise skip rather '
+                                  'than hard-scrape.'},
+                     {   'id': 'vast_ai',
+                         'enabled': True,
+                         'module': 'marketwatch.providers.vast_ai:fetch',
+                         'base_url': 'https://api.vast.ai/v0/bundles/public'},
+                     {   'id': 'runpod',
+                         'enabled': True,
+                         'module': 'marketwatch.providers.runpod:fetch',
+                         'base_url': 'https://api.runpod.io/pricing'},
+                     {   'id': 'lambda',
+                         'enabled': True,
+                         'module': 'marketwatch.providers.lambda_labs:fetch'},
+                     {   'id': 'replicate',
+                         'enabled': True,
+                         'module': 'marketwatch.providers.replicate:fetch'},
+                     {   'id': 'modal',
+                         'enabled': False,
+                         'module': 'marketwatch.providers.modal:fetch'}]}
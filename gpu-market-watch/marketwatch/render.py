@@ -1,9 +1,11 @@
 """Rendering helpers for markdown reports and dashboards."""
 from __future__ import annotations
 
+import hashlib
 import json
 from collections import defaultdict
-from datetime import datetime
+from importlib import resources
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
@@ -12,21 +14,45 @@ try:  # pragma: no cover - optional dependency
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
     pd = None  # type: ignore[assignment]
 
-from .config import DashboardConfig, project_path
-from .schema import GpuPrice
-from .util import log
+from .config import DashboardConfig
+from .schema import GpuPrice, dump_records
+from .util import iso_now, log, tail_lines
+
+_ASSETS = resources.files(__package__).joinpath("_assets")
+# The dashboard script and stylesheet are static; only index.html carries per-run data.
+_APP_JS = _ASSETS.joinpath("app.js").read_text(encoding="utf-8")
+_STYLES_CSS = _ASSETS.joinpath("styles.css").read_text(encoding="utf-8")
+
+
+_REPORT_COLUMNS = ["gpu", "usd_per_hour", "provider_id", "sku", "region", "on_demand", "spot", "fetched_at"]
+_REPORT_ROW = attrgetter(*_REPORT_COLUMNS)
+# Below this many offers the sections fold plain rows in Python; building a DataFrame that is
+# immediately reduced to one row per GPU or provider costs more than the fold itself.
+_FRAME_MIN_RECORDS = 10_000
+_CHEAPEST_COLUMNS = ["gpu", "usd_per_hour", "provider_id", "region", "sku"]
+_MOVERS_COLUMNS = ["gpu", "usd_per_hour", "prev_usd_per_hour", "delta"]
 
 
 def generate_report(prices: Iterable[GpuPrice], history_path: Optional[Path] = None) -> str:
-    records = [p.model_dump() if isinstance(p, GpuPrice) else dict(p) for p in prices]
+    prices = list(prices)
+    all_prices = all(isinstance(p, GpuPrice) for p in prices)
+    if pd is not None and all_prices and len(prices) >= _FRAME_MIN_RECORDS:
+        # Read the report columns straight off the dataclasses instead of dumping each record to a dict.
+        records = pd.DataFrame(list(map(_REPORT_ROW, prices)), columns=_REPORT_COLUMNS)
+        providers = sorted(set(filter(None, records["provider_id"])))
+    else:
+        if all_prices:
+            records = dump_records(prices)
+        else:
+            records = [p.model_dump() if isinstance(p, GpuPrice) else dict(p) for p in prices]
+        providers = sorted({row.get("provider_id") for row in records if row.get("provider_id")})
     summary_lines = ["# GPU Market Daily Report", ""]
-    generated_at = datetime.utcnow().isoformat()
+    generated_at = iso_now()
     summary_lines.append(f"Generated at: `{generated_at}`\n")
-    providers = sorted({row.get("provider_id") for row in records if row.get("provider_id")})
     summary_lines.append(f"Total providers: **{len(providers)}**")
     summary_lines.append(f"Total offers: **{len(records)}**\n")
 
-    if records:
+    if len(records):
         summary_lines.extend(_render_cheapest_section(records))
 
         previous = _load_previous_snapshot(history_path)
@@ -50,84 +76,51 @@ def generate_report(prices: Iterable[GpuPrice], history_path: Optional[Path] = N
     return "\n".join(summary_lines).strip() + "\n"
 
 
-def _render_cheapest_section(records: List[dict]) -> List[str]:
-    section: List[str] = ["## Cheapest per GPU\n"]
-    if pd is not None:
-        df = pd.DataFrame(records)
-        cheapest = df.sort_values("usd_per_hour").groupby("gpu", as_index=False).first()
-        section.append(
-            _dataframe_to_markdown(
-                cheapest,
-                columns=["gpu", "usd_per_hour", "provider_id", "region", "sku"],
-                index=False,
-            )
-        )
-        section.append("")
-        return section
+def _is_frame(records) -> bool:
+    return pd is not None and isinstance(records, pd.DataFrame)
 
-    cheapest_map = {}
-    for row in records:
-        gpu = row.get("gpu")
-        if not gpu:
-            continue
-        current = cheapest_map.get(gpu)
-        if current is None or row.get("usd_per_hour", float("inf")) < current.get("usd_per_hour", float("inf")):
-            cheapest_map[gpu] = row
-    cheapest_rows = sorted(cheapest_map.values(), key=lambda r: r.get("usd_per_hour", float("inf")))
-    section.append(
-        _format_markdown_table(
-            cheapest_rows,
-            ["gpu", "usd_per_hour", "provider_id", "region", "sku"],
-        )
-    )
+
+def _render_cheapest_section(records) -> List[str]:
+    section: List[str] = ["## Cheapest per GPU\n"]
+    if _is_frame(records):
+        cheapest = _cheapest_per_gpu(records)
+        section.append(_dataframe_to_markdown(cheapest, columns=_CHEAPEST_COLUMNS, index=False))
+    else:
+        cheapest_map = _group_cheapest(records)
+        rows = [cheapest_map[gpu] for gpu in sorted(cheapest_map)]
+        section.append(_rows_to_markdown(rows, _CHEAPEST_COLUMNS))
     section.append("")
     return section
 
 
-def _render_movers(previous: List[dict], current: List[dict]) -> str:
-    if pd is not None:
-        prev_df = pd.DataFrame(previous)
-        curr_df = pd.DataFrame(current)
-        movers = _compute_movers(prev_df, curr_df)
-        return (
-            _dataframe_to_markdown(
-                movers,
-                columns=["gpu", "usd_per_hour", "prev_usd_per_hour", "delta"],
-                index=False,
-            )
-            if not movers.empty
-            else ""
-        )
+def _render_movers(previous: List[dict], current) -> str:
+    if _is_frame(current):
+        movers = _compute_movers(pd.DataFrame(previous), current)
+        return _dataframe_to_markdown(movers, columns=_MOVERS_COLUMNS, index=False) if not movers.empty else ""
 
     prev_cheapest = _group_cheapest(previous)
     curr_cheapest = _group_cheapest(current)
     movers: List[dict] = []
-    for gpu, offer in curr_cheapest.items():
+    for gpu in sorted(curr_cheapest):
+        price = curr_cheapest[gpu].get("usd_per_hour")
         prev = prev_cheapest.get(gpu)
-        delta = None
-        prev_price = None
-        if prev is not None:
-            prev_price = prev.get("usd_per_hour")
-            if prev_price is not None:
-                delta = offer.get("usd_per_hour") - prev_price
+        prev_price = prev.get("usd_per_hour") if prev is not None else None
         movers.append(
             {
                 "gpu": gpu,
-                "usd_per_hour": offer.get("usd_per_hour"),
+                "usd_per_hour": price,
                 "prev_usd_per_hour": prev_price,
-                "delta": delta if delta is not None else offer.get("usd_per_hour"),
+                "delta": price - prev_price if prev_price is not None else None,
             }
         )
-    movers = [m for m in movers if m["prev_usd_per_hour"] is not None]
-    movers.sort(key=lambda r: r.get("delta", float("inf")))
-    top = movers[:10]
-    return _format_markdown_table(top, ["gpu", "usd_per_hour", "prev_usd_per_hour", "delta"]) if top else ""
+    # Same order as the DataFrame path: ascending delta, GPUs without a previous price last.
+    movers.sort(key=lambda r: (r["delta"] is None, r["delta"] or 0.0))
+    return _rows_to_markdown(movers[:10], _MOVERS_COLUMNS)
 
 
-def _render_provider_coverage(records: List[dict]) -> str:
-    if pd is not None:
-        df = pd.DataFrame(records)
-        coverage = df.groupby("provider_id").size().reset_index(name="offers")
+def _render_provider_coverage(records) -> str:
+    if _is_frame(records):
+        coverage = records.groupby("provider_id").size().reset_index(name="offers")
         return _dataframe_to_markdown(coverage, columns=["provider_id", "offers"], index=False)
 
     counts = defaultdict(int)
@@ -136,17 +129,33 @@ def _render_provider_coverage(records: List[dict]) -> str:
         if provider:
             counts[provider] += 1
     rows = [{"provider_id": provider, "offers": counts[provider]} for provider in sorted(counts)]
-    return _format_markdown_table(rows, ["provider_id", "offers"])
+    return _rows_to_markdown(rows, ["provider_id", "offers"])
+
+
+def _rows_to_markdown(rows: List[dict], columns: List[str]) -> str:
+    if not rows:
+        return ""
+    if pd is not None:
+        # Render through pandas so small and large reports format identically.
+        return _dataframe_to_markdown(pd.DataFrame.from_records(rows, columns=columns), index=False)
+    return _format_markdown_table(rows, columns)
 
 
 def _compute_movers(prev_df, current_df):
-    prev_cheapest = prev_df.sort_values("usd_per_hour").groupby("gpu", as_index=False).first()
-    curr_cheapest = current_df.sort_values("usd_per_hour").groupby("gpu", as_index=False).first()
+    prev_cheapest = _cheapest_per_gpu(prev_df)
+    curr_cheapest = _cheapest_per_gpu(current_df)
     merged = curr_cheapest.merge(prev_cheapest[["gpu", "usd_per_hour"]], on="gpu", how="left", suffixes=("_current", "_previous"))
     merged["delta"] = merged["usd_per_hour_current"] - merged["usd_per_hour_previous"]
-    merged = merged.sort_values("delta")
+    merged = merged.sort_values("delta", kind="stable")
     merged = merged.rename(columns={"usd_per_hour_current": "usd_per_hour", "usd_per_hour_previous": "prev_usd_per_hour"})
-    return merged[["gpu", "usd_per_hour", "prev_usd_per_hour", "delta"]].head(10)
+    return merged[_MOVERS_COLUMNS].head(10)
+
+
+def _cheapest_per_gpu(df):
+    # idxmin picks each GPU's cheapest row without sorting the full frame; only the
+    # one-row-per-GPU result is sorted, to keep the table order stable.
+    cheapest = df.loc[df.groupby("gpu", sort=False)["usd_per_hour"].idxmin()]
+    return cheapest.sort_values("gpu", ignore_index=True)
 
 
 def _group_cheapest(records: List[dict]) -> Dict[str, dict]:
@@ -199,13 +208,13 @@ def _load_previous_snapshot(history_path: Optional[Path]) -> Optional[List[dict]
     if not history_path or not history_path.exists():
         return None
     try:
-        lines = history_path.read_text(encoding="utf-8").strip().splitlines()
+        lines = tail_lines(history_path, 2)
     except OSError:
         return None
     if len(lines) < 2:
         return None
     try:
-        prev = json.loads(lines[-2])
+        prev = json.loads(lines[0])
     except json.JSONDecodeError:
         return None
     return prev.get("records")
@@ -213,11 +222,11 @@ def _load_previous_snapshot(history_path: Optional[Path]) -> Optional[List[dict]
 
 def _load_changelog(history_path: Path) -> List[str]:
     try:
-        lines = history_path.read_text(encoding="utf-8").strip().splitlines()
+        lines = tail_lines(history_path, 5)
     except OSError:
         return []
     entries = []
-    for line in lines[-5:]:
+    for line in lines:
         try:
             data = json.loads(line)
         except json.JSONDecodeError:
@@ -230,7 +239,7 @@ def _load_changelog(history_path: Path) -> List[str]:
 
 def generate_dashboard(prices: Iterable[GpuPrice], dashboard: DashboardConfig) -> dict[str, str]:
     prices = list(prices)
-    data_path = project_path("data", "gpu_prices.json")
+    config = {"sections": dashboard.sections}
     html = f"""<!DOCTYPE html>
 <html lang=\"en\">
 <head>
@@ -247,114 +256,26 @@ def generate_dashboard(prices: Iterable[GpuPrice], dashboard: DashboardConfig) -
     <div id=\"chart\"></div>
   </main>
   <script>
-    window.DASHBOARD_CONFIG = {json.dumps({"sections": dashboard.sections})};
+    window.DASHBOARD_CONFIG = {json.dumps(config)};
+    window.CACHE_BUST = {json.dumps(_cache_bust_token(prices))};
   </script>
   <script src=\"assets/app.js\"></script>
 </body>
 </html>
-"""
-    css = """
-body { font-family: system-ui, sans-serif; margin: 2rem; background: #0f172a; color: #e2e8f0; }
-main { max-width: 1000px; margin: 0 auto; }
-table { width: 100%; border-collapse: collapse; margin-bottom: 1.5rem; }
-th, td { border: 1px solid #1e293b; padding: 0.5rem; }
-th { background: #1e293b; }
-input, select { padding: 0.5rem; margin-right: 1rem; }
-section { margin-bottom: 2rem; }
-"""
-    js = f"""async function loadData() {{
-  const response = await fetch('../data/gpu_prices.json?_={datetime.utcnow().timestamp()}');
-  const data = await response.json();
-  return data;
-}}
-
-function renderSummary(prices) {{
-  const container = document.getElementById('summary');
-  const offers = prices.length;
-  const providers = new Set(prices.map(p => p.provider_id)).size;
-  container.innerHTML = `<section><h2>Snapshot</h2><p>${{offers}} offers across ${{providers}} providers.</p></section>`;
-}}
-
-function renderTable(prices) {{
-  const container = document.getElementById('table');
-  const providers = [...new Set(prices.map(p => p.provider_id))];
-  container.innerHTML = `
-  <section>
-    <h2>Offers</h2>
-    <label>Filter GPU <input id="gpu-filter" placeholder="e.g. A100" /></label>
-    <label>Provider <select id="provider-filter"><option value="">All</option>${{providers.map(p => `<option>${{p}}</option>`).join('')}}</select></label>
-    <table>
-      <thead><tr><th>GPU</th><th>USD/hr</th><th>Provider</th><th>Region</th><th>SKU</th></tr></thead>
-      <tbody></tbody>
-    </table>
-  </section>`;
-  const tbody = container.querySelector('tbody');
-  function applyFilters() {{
-    const gpu = document.getElementById('gpu-filter').value.toLowerCase();
-    const provider = document.getElementById('provider-filter').value;
-    tbody.innerHTML = prices
-      .filter(p => (!gpu || p.gpu.toLowerCase().includes(gpu)) && (!provider || p.provider_id === provider))
-      .map(p => `<tr><td>${{p.gpu}}</td><td>${{p.usd_per_hour.toFixed(4)}}</td><td>${{p.provider_id}}</td><td>${{p.region || ''}}</td><td>${{p.sku || ''}}</td></tr>`)
-      .join('');
-  }}
-  document.getElementById('gpu-filter').addEventListener('input', applyFilters);
-  document.getElementById('provider-filter').addEventListener('change', applyFilters);
-  applyFilters();
-}}
-
-function renderChart(prices) {{
-  const container = document.getElementById('chart');
-  const cheapest = Object.values(prices.reduce((acc, offer) => {{
-    if (!acc[offer.gpu] || acc[offer.gpu].usd_per_hour > offer.usd_per_hour) {{
-      acc[offer.gpu] = offer;
-    }}
-    return acc;
-  }}, {{}}));
-  cheapest.sort((a, b) => a.usd_per_hour - b.usd_per_hour);
-  container.innerHTML = `<section><h2>Min $/hr by GPU</h2><div class="chart"></div></section>`;
-  const chart = container.querySelector('.chart');
-  chart.style.display = 'grid';
-  chart.style.gap = '0.5rem';
-  cheapest.forEach(item => {{
-    const row = document.createElement('div');
-    const label = document.createElement('div');
-    label.textContent = `${{item.gpu}} (${{item.provider_id}})`;
-    const bar = document.createElement('div');
-    bar.style.height = '16px';
-    bar.style.background = '#38bdf8';
-    bar.style.width = `${{Math.max(item.usd_per_hour * 40, 5)}}px`;
-    const value = document.createElement('span');
-    value.textContent = `$${{item.usd_per_hour.toFixed(4)}}/hr`;
-    value.style.marginLeft = '0.5rem';
-    const wrapper = document.createElement('div');
-    wrapper.style.display = 'flex';
-    wrapper.style.alignItems = 'center';
-    wrapper.appendChild(bar);
-    wrapper.appendChild(value);
-    row.appendChild(label);
-    row.appendChild(wrapper);
-    row.style.display = 'grid';
-    row.style.gridTemplateColumns = '200px 1fr';
-    chart.appendChild(row);
-  }});
-}}
-
-(async function init() {{
-  try {{
-    const prices = await loadData();
-    renderSummary(prices);
-    renderTable(prices);
-    renderChart(prices);
-  }} catch (error) {{
-    console.error('Failed to load dashboard data', error);
-  }}
-}})();
 """
     return {
         "index.html": html,
-        "assets/app.js": js,
-        "assets/styles.css": css,
+        "assets/app.js": _APP_JS,
+        "assets/styles.css": _STYLES_CSS,
     }
 
 
+def _cache_bust_token(prices: List[GpuPrice]) -> str:
+    # Derived from the offers themselves, so index.html only changes when the prices do.
+    digest = hashlib.blake2b(digest_size=8)
+    for price in prices:
+        digest.update(price.content_hash.encode("ascii"))
+    return digest.hexdigest()
+
+
 __all__ = ["generate_report", "generate_dashboard"]
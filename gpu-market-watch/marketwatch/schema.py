@@ -1,25 +1,15 @@
 """Data schema definitions for normalized GPU pricing."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
-from typing import Dict, Iterable, List, Optional
+from operator import attrgetter
+from typing import Callable, Dict, Iterable, List, Optional
 
-from .util import normalize_gpu_name, stable_hash
+from .util import normalize_gpu_name, parse_datetime, stable_hash
 
 
-def _to_utc(value: datetime | str) -> datetime:
-    if isinstance(value, datetime):
-        if value.tzinfo is None:
-            return value.replace(tzinfo=timezone.utc)
-        return value.astimezone(timezone.utc)
-    parsed = datetime.fromisoformat(str(value))
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
-    return parsed.astimezone(timezone.utc)
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GpuPrice:
     """Canonical GPU price record."""
 
@@ -41,60 +31,136 @@ class GpuPrice:
         if usd_per_hour < 0:
             raise ValueError("usd_per_hour must be non-negative")
         object.__setattr__(self, "usd_per_hour", usd_per_hour)
-        object.__setattr__(self, "fetched_at", _to_utc(self.fetched_at))
-        object.__setattr__(self, "generated_at", _to_utc(self.generated_at))
+        object.__setattr__(self, "fetched_at", parse_datetime(self.fetched_at))
+        object.__setattr__(self, "generated_at", parse_datetime(self.generated_at))
         if self.on_demand is not None:
             object.__setattr__(self, "on_demand", bool(self.on_demand))
         if self.spot is not None:
             object.__setattr__(self, "spot", bool(self.spot))
+        # Empty strings rather than None keep region/sku directly comparable in sort keys.
+        if self.sku is None:
+            object.__setattr__(self, "sku", "")
+        if self.region is None:
+            object.__setattr__(self, "region", "")
         object.__setattr__(self, "source_url", str(self.source_url))
         object.__setattr__(self, "content_hash", str(self.content_hash))
 
     def model_dump(self, mode: str = "python") -> Dict[str, object]:
-        payload: Dict[str, object] = {
-            "gpu": self.gpu,
-            "usd_per_hour": self.usd_per_hour,
-            "provider_id": self.provider_id,
-            "sku": self.sku,
-            "region": self.region,
-            "on_demand": self.on_demand,
-            "spot": self.spot,
-            "source_url": self.source_url,
-            "fetched_at": self.fetched_at,
-            "generated_at": self.generated_at,
-            "content_hash": self.content_hash,
-        }
         if mode == "json":
-            payload = {
-                key: (value.isoformat() if isinstance(value, datetime) else value)
-                for key, value in payload.items()
+            # fetched_at and generated_at are the only datetime fields.
+            return {
+                "gpu": self.gpu,
+                "usd_per_hour": self.usd_per_hour,
+                "provider_id": self.provider_id,
+                "sku": self.sku,
+                "region": self.region,
+                "on_demand": self.on_demand,
+                "spot": self.spot,
+                "source_url": self.source_url,
+                "fetched_at": self.fetched_at.isoformat(),
+                "generated_at": self.generated_at.isoformat(),
+                "content_hash": self.content_hash,
             }
-        return payload
+        return dict(zip(_DUMP_FIELDS, _DUMP_VALUES(self)))
+
+
+_DUMP_FIELDS = tuple(f.name for f in fields(GpuPrice))
+_DUMP_VALUES = attrgetter(*_DUMP_FIELDS)
+
+
+def dump_records(records: Iterable[GpuPrice], mode: str = "python") -> List[Dict[str, object]]:
+    """Dump many records at once; equivalent to ``[r.model_dump(mode) for r in records]``."""
+    payloads: List[Dict[str, object]] = [dict(zip(_DUMP_FIELDS, _DUMP_VALUES(record))) for record in records]
+    if mode == "json":
+        for payload in payloads:
+            payload["fetched_at"] = payload["fetched_at"].isoformat()  # type: ignore[attr-defined]
+            payload["generated_at"] = payload["generated_at"].isoformat()  # type: ignore[attr-defined]
+    return payloads
 
 
 def validate_and_normalize(record: dict, generated_at: datetime) -> GpuPrice:
     """Validate a raw record dict and compute derived fields."""
-    record = {**record}
-    record.setdefault("generated_at", generated_at)
-    record.setdefault("source_url", "")
-    record["gpu"] = normalize_gpu_name(record.get("gpu", ""))
-    record["usd_per_hour"] = float(record.get("usd_per_hour", 0))
-    if record["usd_per_hour"] < 0:
+    return _build_price(record, generated_at, parse_datetime)
+
+
+def validate_and_normalize_batch(records: Iterable[dict], generated_at: datetime) -> List[GpuPrice]:
+    """Validate many raw records, converting each distinct timestamp to UTC only once.
+
+    Providers stamp every record with the same fetch time, so the batch shares those
+    conversions instead of repeating them per record.
+    """
+    converted: Dict[object, datetime] = {}
+
+    def to_utc(value: datetime | str) -> datetime:
+        result = converted.get(value)
+        if result is None:
+            result = converted[value] = parse_datetime(value)
+        return result
+
+    return [_build_price(record, generated_at, to_utc) for record in records]
+
+
+_FIELD_NAMES = frozenset(_DUMP_FIELDS)
+_set_field = object.__setattr__
+
+
+def _build_price(record: dict, generated_at: datetime, to_utc: Callable[[datetime | str], datetime]) -> GpuPrice:
+    # Coerces exactly what GpuPrice.__post_init__ would, then fills the slots directly so the
+    # already-clean values are not normalized a second time.
+    unknown = record.keys() - _FIELD_NAMES
+    if unknown:
+        raise TypeError(f"GpuPrice got unexpected fields: {', '.join(sorted(unknown))}")
+    if "provider_id" not in record:
+        raise TypeError("GpuPrice missing required field: 'provider_id'")
+    provider_id = record["provider_id"]
+    gpu = normalize_gpu_name(record.get("gpu", ""))
+    usd_per_hour = float(record.get("usd_per_hour", 0))
+    if usd_per_hour < 0:
         raise ValueError("usd_per_hour must be non-negative")
-    record["fetched_at"] = _to_utc(record.get("fetched_at", generated_at))
-    record["generated_at"] = _to_utc(record.get("generated_at", generated_at))
-    record["content_hash"] = stable_hash(
+    # Normalized before hashing, so a missing region/sku hashes the same as the stored "".
+    sku = record.get("sku")
+    if sku is None:
+        sku = ""
+    region = record.get("region")
+    if region is None:
+        region = ""
+    on_demand = record.get("on_demand")
+    if on_demand is not None:
+        on_demand = bool(on_demand)
+    spot = record.get("spot")
+    if spot is not None:
+        spot = bool(spot)
+    content_hash = stable_hash(
         {
-            "provider_id": record.get("provider_id"),
-            "gpu": record.get("gpu"),
-            "usd_per_hour": round(float(record.get("usd_per_hour", 0)), 4),
-            "region": record.get("region"),
-            "sku": record.get("sku"),
-            "on_demand": bool(record.get("on_demand")) if record.get("on_demand") is not None else None,
-            "spot": bool(record.get("spot")) if record.get("spot") is not None else None,
+            "provider_id": provider_id,
+            "gpu": gpu,
+            "usd_per_hour": round(usd_per_hour, 4),
+            "region": region,
+            "sku": sku,
+            "on_demand": on_demand,
+            "spot": spot,
         }
     )
-    return GpuPrice(**record)
+    values = (
+        gpu,
+        usd_per_hour,
+        provider_id,
+        sku,
+        region,
+        on_demand,
+        spot,
+        str(record.get("source_url", "")),
+        to_utc(record.get("fetched_at", generated_at)),
+        to_utc(record.get("generated_at", generated_at)),
+        content_hash,
+    )
+    price = object.__new__(GpuPrice)
+    for name, value in zip(_DUMP_FIELDS, values):
+        _set_field(price, name, value)
+    return price
+
+
+_MERGE_KEY = attrgetter("provider_id", "gpu", "region", "sku")
 
 
 def merge_records(records: Iterable[GpuPrice]) -> List[GpuPrice]:
@@ -118,7 +184,13 @@ def merge_records(records: Iterable[GpuPrice]) -> List[GpuPrice]:
             continue
         if rec.usd_per_hour == existing.usd_per_hour and rec.fetched_at > existing.fetched_at:
             merged[key] = rec
-    return sorted(merged.values(), key=lambda r: (r.provider_id, r.gpu, r.region or "", r.sku or ""))
+    return sorted(merged.values(), key=_MERGE_KEY)
 
 
-__all__ = ["GpuPrice", "validate_and_normalize", "merge_records"]
+__all__ = [
+    "GpuPrice",
+    "dump_records",
+    "validate_and_normalize",
+    "validate_and_normalize_batch",
+    "merge_records",
+]
@@ -1,81 +1,113 @@
 """Utility helpers for marketwatch."""
 from __future__ import annotations
 
+import atexit
 import csv
 import hashlib
 import io
 import json
+import mmap
 import os
-import tempfile
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain, count
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 try:  # pragma: no cover - optional dependency
-    import pandas as pd  # type: ignore
+    import orjson  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    pd = None  # type: ignore[assignment]
-
-try:  # pragma: no cover - optional dependency
-    import requests  # type: ignore
-    from requests.adapters import HTTPAdapter  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    requests = None  # type: ignore[assignment]
-    HTTPAdapter = None  # type: ignore[assignment]
-
-try:  # pragma: no cover - optional dependency
-    from urllib3.util.retry import Retry  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    Retry = None  # type: ignore[assignment]
-
-try:  # pragma: no cover - optional dependency
-    from dateutil import parser as date_parser  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover - optional dependency
-    date_parser = None  # type: ignore[assignment]
+    orjson = None  # type: ignore[assignment]
 
 from .config import load_settings, project_path
 
 
+_UTC = timezone.utc
+
 LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
 DEFAULT_LOG_LEVEL = LOG_LEVELS.get(os.getenv("DEEP_MARKET_LOG_LEVEL", "INFO").upper(), 20)
 
 
+_LOG_STAMP: Tuple[int, str] = (-1, "")
+
+
 def log(level: str, message: str) -> None:
-    lvl = LOG_LEVELS.get(level.upper(), 20)
-    if lvl >= DEFAULT_LOG_LEVEL:
-        now = iso_now()
-        print(f"[{now}] {level.upper()}: {message}")
+    # Callers pass upper-case literals, so only unknown spellings pay for upper().
+    lvl = LOG_LEVELS.get(level)
+    if lvl is None:
+        level = level.upper()
+        lvl = LOG_LEVELS.get(level, 20)
+    if lvl < DEFAULT_LOG_LEVEL:
+        return
+    print(f"[{_log_timestamp()}] {level}: {message}")
+
+
+def _log_timestamp() -> str:
+    # Log lines only need second resolution, so format each second once.
+    global _LOG_STAMP
+    second = int(time.time())
+    cached_second, stamp = _LOG_STAMP
+    if second != cached_second:
+        stamp = datetime.fromtimestamp(second, _UTC).isoformat()
+        _LOG_STAMP = (second, stamp)
+    return stamp
 
 
 def iso_now() -> str:
-    return datetime.utcnow().replace(tzinfo=timezone.utc).isoformat()
+    return datetime.now(_UTC).isoformat()
 
 
 def utc_now() -> datetime:
-    return datetime.utcnow().replace(tzinfo=timezone.utc)
+    return datetime.now(_UTC)
 
 
 def parse_datetime(value: Any) -> datetime:
     if isinstance(value, datetime):
+        if value.tzinfo is _UTC:
+            return value
         if value.tzinfo is None:
-            return value.replace(tzinfo=timezone.utc)
-        return value.astimezone(timezone.utc)
-    if date_parser is not None:
-        return date_parser.parse(str(value)).astimezone(timezone.utc)
-    parsed = datetime.fromisoformat(str(value))
+            return value.replace(tzinfo=_UTC)
+        return value.astimezone(_UTC)
+    text = str(value)
+    try:
+        # fromisoformat is implemented in C and covers the ISO 8601 timestamps providers send;
+        # dateutil's much slower parser is only needed for anything looser.
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        date_parser = _date_parser()
+        if date_parser is None:
+            raise
+        parsed = date_parser.parse(text)
     if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
-    return parsed.astimezone(timezone.utc)
+        parsed = parsed.replace(tzinfo=_UTC)
+    return parsed.astimezone(_UTC)
 
 
-def parse_money(value: Any) -> Optional[float]:
-    if value is None:
+@lru_cache(maxsize=1)
+def _date_parser():
+    # Deferred like the HTTP stack: only timestamps fromisoformat rejects need dateutil.
+    try:
+        from dateutil import parser
+    except ModuleNotFoundError:  # pragma: no cover - optional dependency
         return None
+    return parser
+
+
+_MONEY_STRIP = str.maketrans("", "", "$,")
+
+
+def parse_money(value: Any) -> Optional[float]:
+    # Numbers are the common case (JSON payloads); test for them before anything else.
     if isinstance(value, (int, float)):
         return float(value)
-    cleaned = str(value).strip().replace("$", "").replace(",", "")
+    if value is None:
+        return None
     try:
-        return float(cleaned)
+        # float() already ignores surrounding whitespace, so only "$" and "," need removing.
+        return float(str(value).translate(_MONEY_STRIP))
     except ValueError:
         return None
 
@@ -98,104 +130,280 @@ class _OfflineSession:
     def request(self, method: str, url: str, **kwargs):  # pragma: no cover - simple fallback
         raise RuntimeError(self.reason)
 
+    def close(self) -> None:
+        return None
+
+
+def make_session(pool_size: int = 10, pool_connections: Optional[int] = None):
+    # requests/urllib3 are imported here rather than at module level: most util callers
+    # (log, parsing, the artifact writers) never open a session.
+    from . import _http
 
-def make_session():
     settings = load_settings().http
-    if requests is None or HTTPAdapter is None or Retry is None:
+    if not _http.AVAILABLE:
         return _OfflineSession("requests library unavailable")
+    return _http.build_session(settings, pool_size, pool_connections or pool_size)
+
+
+@lru_cache(maxsize=1)
+def get_session():
+    """Return the process-wide session, so keep-alive connections are reused across fetches.
 
-    session = requests.Session()
-    session.headers.update({"User-Agent": settings.user_agent})
-    retry = Retry(
-        total=settings.max_retries,
-        read=settings.max_retries,
-        connect=settings.max_retries,
-        backoff_factor=settings.backoff_s,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=("GET", "POST"),
-    )
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-    session.request = _wrap_request(session.request, settings.timeout_s)  # type: ignore[attr-defined]
+    It is created on first use and closed at interpreter exit.
+    """
+    session = make_session(pool_size=64, pool_connections=32)
+    atexit.register(session.close)
     return session
 
 
-def _wrap_request(func, timeout: int):
-    def wrapped(method: str, url: str, **kwargs):
-        kwargs.setdefault("timeout", timeout)
-        return func(method, url, **kwargs)
+def fetch_all(
+    providers: Sequence[Tuple[Any, Callable[..., List[Any]]]],
+    now: datetime,
+    *,
+    fail_on_any_error: bool = False,
+) -> List[Any]:
+    """Call every ``(cfg, fetch)`` pair concurrently and return the combined records.
 
-    return wrapped
+    Fetches are dominated by network latency, so each runs on its own thread, all sharing the
+    pooled session from ``get_session``. Records arrive in completion order; a failing provider
+    is logged and skipped unless ``fail_on_any_error`` is set.
+    """
+    session = get_session()
+    records: List[Any] = []
+    with ThreadPoolExecutor(max_workers=max(len(providers), 1)) as pool:
+        futures = {pool.submit(func, session, cfg, now): cfg for cfg, func in providers}
+        for future in as_completed(futures):
+            cfg = futures[future]
+            try:
+                fetched = future.result()
+                log("INFO", f"{cfg.id}: fetched {len(fetched)} offers")
+                records.extend(fetched)
+            except Exception as exc:  # pragma: no cover - defensive
+                log("ERROR", f"{cfg.id}: failed with {exc}")
+                if fail_on_any_error:
+                    raise
+    return records
+
+
+def response_json(response) -> Any:
+    """Decode a JSON response body, parsing the raw bytes with orjson when available."""
+    content = getattr(response, "content", None)
+    if orjson is not None and isinstance(content, (bytes, bytearray, memoryview)):
+        return orjson.loads(content)
+    return response.json()
+
+
+def first_present(mapping: Dict[str, Any], keys: Iterable[str], default: Any = None) -> Any:
+    """Return the value of the first key in ``keys`` that is set to something other than ``None``.
+
+    Unlike chaining ``mapping.get(a) or mapping.get(b)``, an empty list or dict counts as present.
+    """
+    for key in keys:
+        value = mapping.get(key)
+        if value is not None:
+            return value
+    return default
 
 
-def stable_hash(payload: Dict[str, Any]) -> str:
-    dumped = json.dumps(payload, sort_keys=True, ensure_ascii=False)
-    return hashlib.sha256(dumped.encode("utf-8")).hexdigest()
+_HASH_FIELDS = ("provider_id", "gpu", "usd_per_hour", "region", "sku", "on_demand", "spot")
 
 
+def stable_hash(payload: Dict[str, Any]) -> str:
+    # Fields are fed to the digest one at a time in _HASH_FIELDS order, each as str(value)
+    # behind a 0x1f separator, so no serialized copy of the payload is ever built.
+    digest = hashlib.blake2b(digest_size=32)
+    for field in _HASH_FIELDS:
+        digest.update(b"\x1f")
+        digest.update(str(payload.get(field)).encode("utf-8"))
+    return digest.hexdigest()
+
+
+_GPU_MAP = {
+    "a100_80g": "A100 80GB",
+    "a100-80g": "A100 80GB",
+    "a100": "A100",
+    "rtx_3090": "RTX 3090",
+    "rtx3090": "RTX 3090",
+    "rtx_4090": "RTX 4090",
+    "rtx4090": "RTX 4090",
+    "h100": "H100",
+    "l40s": "L40S",
+}
+_GPU_KEY_STRIP = str.maketrans("", "", " /")
+# Fallback for longer vendor strings such as "NVIDIA A100 80GB PCIe": the first model token
+# found wins, and alternatives are ordered so longer models are tried first.
+_GPU_MODELS = {
+    # The memory size may follow other tokens, as in "A100-SXM4-80GB", but never skip past
+    # another memory token ("A100 40GB x 80GB RAM") or match inside a number ("1280GB").
+    "A100 80GB": r"a100(?:[ _-](?!\d+\s*gb?(?![a-z0-9]))[a-z0-9]+)*?[ _-]?(?<![0-9])80\s*gb?",
+    "A100": r"a100",
+    "RTX 3090": r"rtx[ _-]?3090(?![ _-]?ti(?![a-z0-9]))",
+    "RTX 4090": r"rtx[ _-]?4090(?![ _-]?(?:ti|d)(?![a-z0-9]))",
+    "H100": r"h100",
+    "L40S": r"l40s",
+}
+_GPU_MODEL_NAMES = list(_GPU_MODELS)
+_GPU_MODEL_RE = re.compile(
+    r"(?<![a-z0-9])(?:"
+    + "|".join(f"(?P<m{index}>{pattern})" for index, pattern in enumerate(_GPU_MODELS.values()))
+    + r")(?![a-z0-9])",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=4096)
 def normalize_gpu_name(name: str) -> str:
-    mapping = {
-        "a100_80g": "A100 80GB",
-        "a100-80g": "A100 80GB",
-        "a100": "A100",
-        "rtx_3090": "RTX 3090",
-        "rtx3090": "RTX 3090",
-        "rtx_4090": "RTX 4090",
-        "rtx4090": "RTX 4090",
-        "h100": "H100",
-        "l40s": "L40S",
-    }
-    key = name.strip().lower().replace(" ", "").replace("/", "")
-    return mapping.get(key, name.strip())
+    key = name.translate(_GPU_KEY_STRIP).strip().lower()
+    canonical = _GPU_MAP.get(key)
+    if canonical:
+        return canonical
+    match = _GPU_MODEL_RE.search(name)
+    if match:
+        return _GPU_MODEL_NAMES[int(match.lastgroup[1:])]
+    return name.strip()
 
 
 def write_json_atomic(path: Path, obj: Any) -> bool:
+    if orjson is not None:
+        # Same layout as the json fallback below (sorted keys, two-space indent, raw UTF-8).
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        return _write_atomic(path, orjson.dumps(obj, option=options))
     payload = json.dumps(obj, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
     return _write_atomic(path, payload.encode("utf-8"))
 
 
-def write_csv_atomic(path: Path, rows: Iterable[Dict[str, Any]]) -> bool:
-    data = list(rows)
-    if pd is not None:
-        df = pd.DataFrame(data)
-        payload = df.to_csv(index=False) if not df.empty else ""
-    else:
+def write_csv_atomic(
+    path: Path, rows: Iterable[Dict[str, Any]], fieldnames: Optional[Sequence[str]] = None
+) -> bool:
+    if fieldnames is None:
+        # Inferring the header needs every row's keys, so the rows are materialized first.
+        data = rows if isinstance(rows, list) else list(rows)
         if not data:
-            payload = ""
-        else:
-            buffer = io.StringIO()
-            fieldnames = sorted({key for row in data for key in row.keys()})
-            writer = csv.DictWriter(buffer, fieldnames=fieldnames)
-            writer.writeheader()
-            for row in data:
-                writer.writerow(row)
-            payload = buffer.getvalue()
-    return _write_atomic(path, payload.encode("utf-8"))
+            return _write_atomic(path, b"")
+        # Columns in first-seen order and "\n" line endings, the layout pandas' to_csv produced.
+        fieldnames = list(dict.fromkeys(key for row in data for key in row))
+    else:
+        # With a known header the rows are consumed once, as they are produced.
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if first is None:
+            return _write_atomic(path, b"")
+        data = chain((first,), iterator)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(fieldnames)
+    writer.writerows([row.get(key) for key in fieldnames] for row in data)
+    return _write_atomic(path, buffer.getvalue().encode("utf-8"))
 
 
 def append_jsonl(path: Path, line: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as fh:
-        fh.write(json.dumps(line, ensure_ascii=False) + "\n")
+    if orjson is not None:
+        payload = orjson.dumps(line, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    else:
+        # Compact separators, as orjson writes, so the history layout does not depend on it.
+        payload = (json.dumps(line, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+    with path.open("ab") as fh:
+        fh.write(payload)
 
 
 def write_text_atomic(path: Path, text: str) -> bool:
     return _write_atomic(path, text.encode("utf-8"))
 
 
+_TMP_COUNTER = count()
+_TMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+
+def _open_temp(path: Path) -> Tuple[int, str]:
+    # PID plus a process-wide counter gives unique sibling names without mkstemp's random
+    # name generation; O_EXCL still guards against leftovers from an earlier run.
+    while True:
+        tmp_path = str(path.parent / f".tmp.{os.getpid()}.{next(_TMP_COUNTER)}{path.suffix}")
+        try:
+            return os.open(tmp_path, _TMP_FLAGS, 0o600), tmp_path
+        except FileExistsError:
+            continue
+
+
 def _write_atomic(path: Path, payload: bytes) -> bool:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=".tmp", suffix=path.suffix)
-    with os.fdopen(tmp_fd, "wb") as fh:
-        fh.write(payload)
-    if path.exists() and path.read_bytes() == payload:
-        os.remove(tmp_path)
+    if _same_contents(path, payload):
         return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_fd, tmp_path = _open_temp(path)
+    try:
+        # The payload is complete up front, so write it straight to the descriptor without a
+        # buffered file object; loop because os.write may write less than asked.
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(tmp_fd, view) :]
+    finally:
+        os.close(tmp_fd)
     os.replace(tmp_path, path)
     return True
 
 
+def _same_contents(path: Path, payload: bytes) -> bool:
+    """Return whether ``path`` already holds exactly ``payload``, checked before any temp file is written."""
+    try:
+        if path.stat().st_size != len(payload):
+            return False
+        if not payload:
+            return True  # Empty files cannot be mapped.
+        with path.open("rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Compare against the page cache directly; pages past the first difference are never touched.
+            with memoryview(mapped) as view:
+                return view == payload
+    except (OSError, ValueError):
+        # Missing file, a filesystem that cannot mmap, or a file truncated to zero after the
+        # size check: report a difference and let the caller do a normal write.
+        return False
+
+
+_TAIL_BLOCK = 8192
+_TAIL_FULL_READ = 64 * 1024
+
+
+def tail_lines(path: Path, n: int) -> List[str]:
+    """Return the last ``n`` lines of ``path``, ignoring trailing blank lines.
+
+    Large files are read backwards in blocks until enough lines are seen, so the cost
+    depends on the size of the tail rather than of the whole file.
+    """
+    if n <= 0:
+        return []
+    with path.open("rb") as fh:
+        pos = fh.seek(0, os.SEEK_END)
+        chunks: List[bytes] = []
+        newlines = 0
+        while pos > 0:
+            step = min(pos, _TAIL_BLOCK) if pos > _TAIL_FULL_READ else pos
+            pos -= step
+            fh.seek(pos)
+            chunk = fh.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+            if newlines > n:
+                blob = b"".join(reversed(chunks)).rstrip()
+                # Stop once n full lines are buffered behind a non-blank partial line.
+                if blob.count(b"\n") >= n and blob[: blob.index(b"\n")].strip():
+                    break
+    blob = b"".join(reversed(chunks))
+    if pos > 0:
+        # Drop the partial line the backward read started in.
+        blob = blob[blob.index(b"\n") + 1 :]
+    text = blob.decode("utf-8")
+    lines = (text.rstrip() if pos > 0 else text.strip()).splitlines()
+    return lines[-n:]
+
+
+@lru_cache(maxsize=64)
+def _cached_json(path: str, mtime_ns: int) -> Any:
+    # mtime_ns is part of the cache key so an edited snapshot is parsed again.
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
 def load_json_snapshot(provider_id: str) -> Optional[Any]:
     """Load a bundled JSON snapshot for a provider.
 
@@ -207,18 +415,20 @@ def load_json_snapshot(provider_id: str) -> Optional[Any]:
     Returns
     -------
     Optional[Any]
-        Parsed JSON object if the snapshot exists, otherwise ``None``.
+        Parsed JSON object if the snapshot exists, otherwise ``None``. The object is
+        cached and shared between calls, so callers must treat it as read-only.
     """
 
     if not provider_id:
         return None
 
     snapshot_path = project_path("config", "snapshots", f"{provider_id}.json")
-    if not snapshot_path.exists():
+    try:
+        mtime_ns = snapshot_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return None
     try:
-        with snapshot_path.open("r", encoding="utf-8") as fh:
-            return json.load(fh)
+        return _cached_json(str(snapshot_path), mtime_ns)
     except Exception as exc:  # pragma: no cover - defensive
         log("WARN", f"{provider_id}: failed to load bundled snapshot ({exc})")
         return None
@@ -232,11 +442,16 @@ __all__ = [
     "parse_money",
     "parse_float",
     "make_session",
+    "get_session",
+    "fetch_all",
+    "response_json",
+    "first_present",
     "stable_hash",
     "normalize_gpu_name",
     "write_json_atomic",
     "write_csv_atomic",
     "append_jsonl",
     "write_text_atomic",
+    "tail_lines",
     "load_json_snapshot",
 ]
@@ -0,0 +1,46 @@
+"""Regenerate ``marketwatch/providers_default.py`` from ``config/providers.yaml``.
+
+Run from the ``gpu-market-watch`` directory after editing the provider config::
+
+    python scripts/build_providers_default.py
+"""
+from __future__ import annotations
+
+import pprint
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from marketwatch import config  # noqa: E402
+
+TEMPLATE = '''"""Prebuilt copy of ``config/providers.yaml``.
+
+Generated by ``scripts/build_providers_default.py``; do not edit by hand. ``load_providers``
+uses it only while ``SOURCE_DIGEST`` matches the YAML file on disk.
+"""
+
+SOURCE_DIGEST = {digest!r}
+
+DATA = {data}
+'''
+
+
+def main() -> None:
+    source = config.CONFIG_DIR / "providers.yaml"
+    data = config._parse_yaml_file(source)
+    if data is None:
+        raise SystemExit(f"could not parse {source}")
+    target = config.ROOT / "marketwatch" / "providers_default.py"
+    target.write_text(
+        TEMPLATE.format(
+            digest=config._config_digest(source.read_bytes()),
+            data=pprint.pformat(data, indent=4, width=100, sort_dicts=False),
+        ),
+        encoding="utf-8",
+    )
+    print(f"wrote {target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+from datetime import datetime, timezone
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def now():
+    return datetime.now(tz=timezone.utc)
@@ -48,3 +48,22 @@ def test_known_env_shortcuts_apply(monkeypatch, tmp_path):
     providers = load_providers(cfg_path)
     runpod = next(p for p in providers if p.id == "runpod")
     assert runpod.extra["token"] == "secret-key"
+
+
+def test_env_prefix_collision_goes_to_longest_id(monkeypatch, tmp_path):
+    cfg_path = _write_provider_cfg(
+        tmp_path,
+        """
+        providers:
+          - id: "vast"
+            module: "marketwatch.providers.vast_ai:fetch"
+          - id: "vast_ai"
+            module: "marketwatch.providers.vast_ai:fetch"
+        """,
+    )
+    monkeypatch.setenv("GPU_MARKET_VAST_FOO", "one")
+    monkeypatch.setenv("GPU_MARKET_VAST_AI_TOKEN", "secret")
+    load_providers.cache_clear()
+    providers = {p.id: p for p in load_providers(cfg_path)}
+    assert providers["vast"].extra == {"foo": "one"}
+    assert providers["vast_ai"].extra["token"] == "secret"
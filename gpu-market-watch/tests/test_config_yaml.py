@@ -0,0 +1,68 @@
+"""Tests for YAML config loading and caching."""
+
+from __future__ import annotations
+
+from marketwatch import config
+
+
+def test_load_yaml_cache_returns_copies_and_tracks_edits(tmp_path):
+    cfg_path = tmp_path / "settings.yaml"
+    cfg_path.write_text("http:\n  timeout_s: 10\n")
+
+    first = config._load_yaml(cfg_path)
+    first["http"]["timeout_s"] = 99
+    assert config._load_yaml(cfg_path) == {"http": {"timeout_s": 10}}
+
+    cfg_path.write_text("http:\n  timeout_s: 120\n")
+    assert config._load_yaml(cfg_path) == {"http": {"timeout_s": 120}}
+
+
+def test_simple_parser_matches_bundled_configs():
+    providers = (config.CONFIG_DIR / "providers.yaml").read_text()
+    parsed = config._parse_simple_yaml(providers)
+    assert parsed == config._FALLBACK_CONFIGS["providers.yaml"]
+
+    dashboard = (config.CONFIG_DIR / "dashboard.yaml").read_text()
+    assert config._parse_simple_yaml(dashboard) == config._FALLBACK_CONFIGS["dashboard.yaml"]
+
+
+def test_simple_parser_handles_nested_list_items():
+    text = "items:\n  - name: a\n    tags:\n      - x\n      - y\n  - name: b\n    notes: |\n      one\n      two\n"
+    assert config._parse_simple_yaml(text) == {
+        "items": [
+            {"name": "a", "tags": ["x", "y"]},
+            {"name": "b", "notes": "one\ntwo"},
+        ]
+    }
+
+
+def test_load_yaml_reuses_json_sidecar(monkeypatch, tmp_path):
+    cfg_path = tmp_path / "dashboard.yaml"
+    cfg_path.write_text("title: Sidecar\n")
+    assert config._load_yaml(cfg_path) == {"title": "Sidecar"}
+    assert (tmp_path / "dashboard.yaml.cache.json").exists()
+
+    def _fail(path):
+        raise AssertionError("YAML should not be re-parsed")
+
+    config._YAML_CACHE.clear()
+    monkeypatch.setattr(config, "_parse_yaml_file", _fail)
+    assert config._load_yaml(cfg_path) == {"title": "Sidecar"}
+
+
+def test_prebuilt_providers_match_yaml():
+    from marketwatch import providers_default
+
+    cfg_path = config.CONFIG_DIR / "providers.yaml"
+    assert providers_default.SOURCE_DIGEST == config._config_digest(cfg_path.read_bytes())
+    assert providers_default.DATA == config._parse_yaml_file(cfg_path)
+
+
+def test_load_yaml_skips_sidecar_for_non_str_keys(tmp_path):
+    cfg_path = tmp_path / "dashboard.yaml"
+    cfg_path.write_text("codes:\n  404: missing\n")
+    expected = config._parse_yaml_file(cfg_path)
+    assert config._load_yaml(cfg_path) == expected
+    assert not (tmp_path / "dashboard.yaml.cache.json").exists()
+    config._YAML_CACHE.clear()
+    assert config._load_yaml(cfg_path) == expected
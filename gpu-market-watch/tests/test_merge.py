@@ -41,3 +41,10 @@ def test_merge_prefers_cheapest_and_latest():
     assert merged[0].fetched_at == records[1].fetched_at
 
 
+def test_merge_sorts_with_missing_region_and_sku(now):
+    records = [
+        validate_and_normalize({"gpu": "H100", "usd_per_hour": 3.0, "provider_id": "runpod", "region": "eu"}, now),
+        validate_and_normalize({"gpu": "H100", "usd_per_hour": 2.0, "provider_id": "runpod"}, now),
+    ]
+    merged = merge_records(records)
+    assert [(r.region, r.sku) for r in merged] == [("", ""), ("eu", "")]
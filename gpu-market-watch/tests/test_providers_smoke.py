@@ -1,14 +1,18 @@
-from datetime import datetime, timezone
+import json
+
+import pytest
 
 from marketwatch.config import ProviderConfig
-from marketwatch.providers import lambda_labs, replicate, runpod, vast_ai
+from marketwatch.providers import lambda_labs, modal, replicate, runpod, vast_ai
 from marketwatch.schema import GpuPrice
+from marketwatch.util import normalize_gpu_name, parse_money
 
 
 class DummyResponse:
     def __init__(self, data, text=""):
         self._data = data
         self.text = text
+        self.content = json.dumps(data).encode("utf-8")
 
     def raise_for_status(self):
         return None
@@ -31,8 +35,7 @@ class ErrorSession:
         raise RuntimeError("boom")
 
 
-def test_runpod_fetch_normalizes_records():
-    now = datetime.now(tz=timezone.utc)
+def test_runpod_fetch_normalizes_records(now):
     session = DummySession(
         {
             "data": [
@@ -52,8 +55,7 @@ def test_runpod_fetch_normalizes_records():
     assert results[0].provider_id == "runpod"
 
 
-def test_vast_ai_fetch_handles_missing_fields():
-    now = datetime.now(tz=timezone.utc)
+def test_vast_ai_fetch_handles_missing_fields(now):
     session = DummySession({"offers": [{"gpu_name": "RTX 3090", "dph_total": 0.5}]})
     cfg = ProviderConfig(id="vast_ai", enabled=True, module="marketwatch.providers.vast_ai:fetch", extra={"base_url": "http://mock"})
     results = vast_ai.fetch(session, cfg, now)
@@ -61,27 +63,64 @@ def test_vast_ai_fetch_handles_missing_fields():
     assert results[0].spot is True
 
 
-def test_runpod_fetch_falls_back_to_snapshot():
-    now = datetime.now(tz=timezone.utc)
+def test_runpod_fetch_falls_back_to_snapshot(now):
     cfg = ProviderConfig(id="runpod", enabled=True, module="marketwatch.providers.runpod:fetch", extra={})
     results = runpod.fetch(ErrorSession(), cfg, now)
     assert len(results) >= 1
     assert all(isinstance(result, GpuPrice) for result in results)
 
 
-def test_lambda_fetch_falls_back_to_snapshot():
-    now = datetime.now(tz=timezone.utc)
+def test_lambda_fetch_falls_back_to_snapshot(now):
     cfg = ProviderConfig(id="lambda", enabled=True, module="marketwatch.providers.lambda_labs:fetch", extra={})
     results = lambda_labs.fetch(ErrorSession(), cfg, now)
     assert len(results) >= 1
     assert all(result.on_demand for result in results)
 
 
-def test_replicate_fetch_falls_back_to_snapshot():
-    now = datetime.now(tz=timezone.utc)
+def test_replicate_fetch_falls_back_to_snapshot(now):
     cfg = ProviderConfig(id="replicate", enabled=True, module="marketwatch.providers.replicate:fetch", extra={})
     results = replicate.fetch(ErrorSession(), cfg, now)
     assert len(results) >= 1
     assert all(isinstance(result, GpuPrice) for result in results)
 
 
+def test_vast_ai_fetch_treats_empty_offers_as_present(now):
+    session = DummySession({"offers": [], "data": [{"gpu_name": "RTX 3090", "dph_total": 0.5}]})
+    cfg = ProviderConfig(id="vast_ai", enabled=True, module="marketwatch.providers.vast_ai:fetch", extra={"base_url": "http://mock"})
+    assert vast_ai.fetch(session, cfg, now) == []
+
+
+MODAL_HTML = """<?xml version="1.0" encoding="utf-8"?>
+<html><body>
+<table>
+  <tr><th> GPU </th><th>Plan</th><th>$/hr</th></tr>
+  <tr><td> <b>H100</b>
+  </td><td> starter </td><td>$3.95<script>x=1</script><!-- promo --></td></tr>
+  <tr><td>A100 80GB</td><td></td><td> $2,50 </td></tr>
+  <tr><form><td>L4</td><td>team</td><td>$0.80</td></form></tr>
+  <tr><td>L40S</td><td>team</td></tr>
+  <tr><td>T4</td><td>free</td><td>n/a</td></tr>
+</table>
+</body></html>
+"""
+
+
+def test_modal_lxml_rows_match_beautifulsoup(now):
+    bs4 = pytest.importorskip("bs4")
+    cfg = ProviderConfig(id="modal", enabled=True, module="marketwatch.providers.modal:fetch", extra={"base_url": "http://mock"})
+    results = modal.fetch(DummySession({}, MODAL_HTML), cfg, now)
+
+    table = bs4.BeautifulSoup(MODAL_HTML, "lxml").find("table")
+    headers = [th.get_text(strip=True).lower() for th in table.find_all("th")]
+    expected = []
+    for row in table.find_all("tr"):
+        cells = [td.get_text(strip=True) for td in row.find_all("td")]
+        if cells and len(cells) == len(headers):
+            data = dict(zip(headers, cells))
+            if parse_money(data["$/hr"]) is not None:
+                expected.append((data["gpu"], parse_money(data["$/hr"]), data["plan"]))
+
+    assert [(r.gpu, r.usd_per_hour, r.sku) for r in results] == [
+        (normalize_gpu_name(gpu), price, sku) for gpu, price, sku in expected
+    ]
+    assert [(r.gpu, r.usd_per_hour) for r in results] == [("H100", 3.95), ("A100 80GB", 250.0), ("L4", 0.8)]
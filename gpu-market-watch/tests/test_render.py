@@ -0,0 +1,45 @@
+"""Tests for report rendering."""
+
+from __future__ import annotations
+
+import json
+import re
+
+import pytest
+
+from marketwatch import render
+from marketwatch.schema import dump_records, validate_and_normalize_batch
+
+
+def _strip_timestamp(report: str) -> str:
+    return re.sub(r"Generated at: `[^`]*`", "", report)
+
+
+def test_report_is_the_same_with_and_without_dataframes(monkeypatch, tmp_path, now):
+    pytest.importorskip("pandas")
+    raw = [
+        {"gpu": "H100", "usd_per_hour": 2.5, "provider_id": "a", "region": "us"},
+        {"gpu": "H100", "usd_per_hour": 2.0, "provider_id": "b"},
+        {"gpu": "A100", "usd_per_hour": 1.0, "provider_id": "a", "sku": "x"},
+        {"gpu": "L40S", "usd_per_hour": 0.9, "provider_id": "c"},
+    ]
+    prices = validate_and_normalize_batch(raw, now)
+    previous = dump_records(validate_and_normalize_batch(raw[:3], now), mode="json")
+    history = tmp_path / "history.jsonl"
+    history.write_text(
+        json.dumps({"generated_at": "earlier", "records": previous})
+        + "\n"
+        + json.dumps({"generated_at": "latest", "records": []})
+        + "\n"
+    )
+
+    monkeypatch.setattr(render, "_FRAME_MIN_RECORDS", 0)
+    with_frames = render.generate_report(prices, history)
+    monkeypatch.setattr(render, "_FRAME_MIN_RECORDS", 10**9)
+    folded = render.generate_report(prices, history)
+    assert _strip_timestamp(with_frames) == _strip_timestamp(folded)
+
+
+def test_report_timestamp_is_utc_aware():
+    report = render.generate_report([])
+    assert re.search(r"Generated at: `[^`]*\+00:00`", report)
@@ -1,6 +1,13 @@
 from datetime import datetime, timezone
 
-from marketwatch.schema import GpuPrice, merge_records, validate_and_normalize
+from marketwatch import util
+from marketwatch.schema import (
+    GpuPrice,
+    dump_records,
+    merge_records,
+    validate_and_normalize,
+    validate_and_normalize_batch,
+)
 
 
 def test_validate_and_normalize_generates_hash():
@@ -23,3 +30,46 @@ def test_validate_and_normalize_generates_hash():
     assert dumped["generated_at"].tzinfo is not None
 
 
+def test_batch_matches_single_record_validation(now):
+    records = [
+        {"gpu": "rtx4090", "usd_per_hour": 0.7, "provider_id": "test", "fetched_at": now},
+        {"gpu": "H100", "usd_per_hour": "2.5", "provider_id": "test", "region": "eu", "spot": 1, "fetched_at": now},
+    ]
+    batch = validate_and_normalize_batch(records, now)
+    assert batch == [validate_and_normalize(record, now) for record in records]
+    assert batch[0].gpu == "RTX 4090"
+
+
+def test_dump_records_matches_model_dump(now):
+    records = validate_and_normalize_batch(
+        [{"gpu": "A100", "usd_per_hour": 1.0, "provider_id": "test", "sku": "x", "fetched_at": now}],
+        now,
+    )
+    assert dump_records(records) == [r.model_dump() for r in records]
+    assert dump_records(records, mode="json") == [r.model_dump(mode="json") for r in records]
+
+
+def test_batch_records_match_dataclass_construction(now):
+    records = validate_and_normalize_batch(
+        [{"gpu": " rtx4090", "usd_per_hour": "0.5", "provider_id": "test", "on_demand": 1, "fetched_at": now.replace(tzinfo=None)}],
+        now,
+    )
+    assert records == [GpuPrice(**records[0].model_dump())]
+    assert records[0].on_demand is True
+    assert records[0].fetched_at.tzinfo is timezone.utc
+
+
+def test_missing_region_and_sku_hash_like_empty_strings(now):
+    base = {"gpu": "A100", "usd_per_hour": 1.0, "provider_id": "test", "fetched_at": now}
+    missing = validate_and_normalize({**base, "region": None}, now)
+    empty = validate_and_normalize({**base, "region": "", "sku": ""}, now)
+    assert missing.region == empty.region == ""
+    assert missing.content_hash == empty.content_hash
+
+
+def test_string_timestamps_go_through_parse_datetime(now):
+    record = {"gpu": "A100", "usd_per_hour": 1.0, "provider_id": "test", "fetched_at": "2024-05-01T12:00:00+02:00"}
+    assert validate_and_normalize(record, now).fetched_at == datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+    if util._date_parser() is not None:
+        loose = validate_and_normalize({**record, "fetched_at": "May 1 2024 10:00"}, now)
+        assert loose.fetched_at == datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
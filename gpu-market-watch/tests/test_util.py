@@ -0,0 +1,116 @@
+"""Tests for file and parsing helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from marketwatch import util
+from marketwatch.util import (
+    append_jsonl,
+    fetch_all,
+    normalize_gpu_name,
+    parse_datetime,
+    tail_lines,
+    write_csv_atomic,
+    write_text_atomic,
+)
+
+
+def test_write_text_atomic_skips_identical_content(tmp_path):
+    target = tmp_path / "nested" / "out.txt"
+    assert write_text_atomic(target, "hello") is True
+    mtime = target.stat().st_mtime_ns
+    assert write_text_atomic(target, "hello") is False
+    assert target.stat().st_mtime_ns == mtime
+    assert write_text_atomic(target, "hello!") is True
+    assert target.read_text() == "hello!"
+    assert [p.name for p in target.parent.iterdir()] == ["out.txt"]
+
+
+def test_normalize_gpu_name_aliases_and_passthrough():
+    assert normalize_gpu_name(" RTX 4090") == "RTX 4090"
+    assert normalize_gpu_name("rtx/3090") == "RTX 3090"
+    assert normalize_gpu_name("A100-80G") == "A100 80GB"
+    assert normalize_gpu_name("A100 80GB") == "A100 80GB"
+    assert normalize_gpu_name(" A10G ") == "A10G"
+
+
+def test_normalize_gpu_name_finds_model_in_vendor_strings():
+    assert normalize_gpu_name("NVIDIA A100 80GB PCIe") == "A100 80GB"
+    assert normalize_gpu_name("NVIDIA A100-SXM4-40GB") == "A100"
+    assert normalize_gpu_name("NVIDIA A100-SXM4-80GB") == "A100 80GB"
+    assert normalize_gpu_name("A100 SXM4 80GB") == "A100 80GB"
+    assert normalize_gpu_name("NVIDIA A100 80 GB PCIe") == "A100 80GB"
+    assert normalize_gpu_name("NVIDIA A100-40GB 1280GB") == "A100"
+    assert normalize_gpu_name("A100 40GB x 80GB RAM") == "A100"
+    assert normalize_gpu_name("NVIDIA GeForce RTX 4090 D") == "NVIDIA GeForce RTX 4090 D"
+    assert normalize_gpu_name("NVIDIA GeForce RTX 4090") == "RTX 4090"
+    assert normalize_gpu_name("gpu_1x_h100_pcie") == "H100"
+    assert normalize_gpu_name("RTX 3090 Ti") == "RTX 3090 Ti"
+    assert normalize_gpu_name("A1000") == "A1000"
+
+
+def test_tail_lines_reads_backwards_across_blocks(monkeypatch, tmp_path):
+    target = tmp_path / "history.jsonl"
+    lines = [f'{{"run": {i}, "pad": "{"x" * 50}"}}' for i in range(40)]
+    target.write_text("\n".join(lines) + "\n\n")
+    monkeypatch.setattr(util, "_TAIL_BLOCK", 16)
+    monkeypatch.setattr(util, "_TAIL_FULL_READ", 0)
+    assert tail_lines(target, 2) == lines[-2:]
+    assert tail_lines(target, 5) == lines[-5:]
+    assert tail_lines(target, 100) == lines
+
+
+def test_fetch_all_combines_results_and_skips_failures(now):
+
+    def ok(session, cfg, when):
+        return [cfg.id, when]
+
+    def broken(session, cfg, when):
+        raise RuntimeError("boom")
+
+    providers = [(SimpleNamespace(id="a"), ok), (SimpleNamespace(id="b"), broken), (SimpleNamespace(id="c"), ok)]
+    assert sorted(map(str, fetch_all(providers, now))) == sorted(["a", "c", str(now), str(now)])
+
+
+def test_parse_datetime_normalizes_to_utc():
+    assert parse_datetime("2024-05-01T12:00:00+02:00") == datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+    assert parse_datetime("2024-05-01 10:00:00Z").tzinfo is timezone.utc
+    assert parse_datetime("2024-05-01T10:00:00") == datetime(2024, 5, 1, 10, tzinfo=timezone.utc)
+
+
+def test_write_csv_atomic_streams_rows_with_known_fieldnames(tmp_path):
+    rows = [{"gpu": "A100", "usd_per_hour": 1.5}, {"gpu": "H100", "region": "eu"}]
+    inferred, streamed = tmp_path / "inferred.csv", tmp_path / "streamed.csv"
+    write_csv_atomic(inferred, rows)
+    write_csv_atomic(streamed, iter(rows), fieldnames=["gpu", "usd_per_hour", "region"])
+    assert streamed.read_bytes() == inferred.read_bytes()
+    assert write_csv_atomic(tmp_path / "empty.csv", iter([]), fieldnames=["gpu"]) is True
+    assert (tmp_path / "empty.csv").read_bytes() == b""
+
+
+def test_append_jsonl_layout_does_not_depend_on_orjson(monkeypatch, tmp_path):
+    record = {"gpu": "A100 80GB", "usd_per_hour": 1.25, "sku": "é"}
+    line = {"generated_at": "2024-05-01T10:00:00+00:00", "records": [record]}
+    fallback = tmp_path / "fallback.jsonl"
+    with monkeypatch.context() as patch:
+        patch.setattr(util, "orjson", None)
+        append_jsonl(fallback, line)
+    assert b", " not in fallback.read_bytes() and b": " not in fallback.read_bytes()
+    if util.orjson is not None:
+        fast = tmp_path / "fast.jsonl"
+        append_jsonl(fast, line)
+        assert fast.read_bytes() == fallback.read_bytes()
+
+
+def test_write_text_atomic_falls_back_when_mmap_fails(monkeypatch, tmp_path):
+    target = tmp_path / "out.txt"
+    target.write_text("hello")
+
+    def _unmappable(*args, **kwargs):
+        raise OSError("mmap not supported")
+
+    monkeypatch.setattr(util.mmap, "mmap", _unmappable)
+    assert write_text_atomic(target, "hello") is True
+    assert target.read_text() == "hello"